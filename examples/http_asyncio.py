@@ -5,7 +5,6 @@ Note: only Python 3.5+ compatible.
 """
 import pook
 import paco
-import aiohttp
 from riprova import retry
 
 # Define HTTP mocks to simulate failed scenarios
@@ -28,12 +27,21 @@ async def on_retry(err, next_try):
 
 # Register retriable operation with custom evaluator
 @retry(evaluator=evaluator, on_retry=on_retry)
-async def fetch(url):
+async def fetch(session, url):
+    async with session.get(url) as response:
+        return response.status
+
+
+async def main():
+    # Deferred import, only paid when the request is actually run
+    import aiohttp
+
+    # Share the same HTTP session across retry attempts
     async with aiohttp.ClientSession() as session:
-        async with session.get(url) as response:
-            return response.status
+        return await fetch(session, 'http://server.com')
 
 
-# Run request
-status = paco.run(fetch('http://server.com'))
-print('Response status:', status)
+if __name__ == '__main__':
+    # Run request
+    status = paco.run(main())
+    print('Response status:', status)
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 import pook
-import requests
 from riprova import retry
 
 # Define HTTP mocks
@@ -23,9 +22,19 @@ def on_retry(err, next_try):
 
 # Register retriable operation
 @retry(evaluator=evaluator, on_retry=on_retry)
-def fetch(url):
-    return requests.get(url)
+def fetch(session, url):
+    return session.get(url)
 
 
-# Run request
-fetch('http://server.com')
+def main():
+    # Deferred import, only paid when the request is actually run
+    import requests
+
+    # Share the same HTTP session across retry attempts
+    with requests.Session() as session:
+        return fetch(session, 'http://server.com')
+
+
+if __name__ == '__main__':
+    # Run request
+    main()
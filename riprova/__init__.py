@@ -4,10 +4,23 @@ from .retrier import Retrier
 from .backoff import Backoff
 from .errors import ErrorWhitelist, ErrorBlacklist, add_whitelist_error
 from .strategies import *  # noqa
-from .async_retrier import AsyncRetrier  # noqa
+from .constants import PY_37
 from .exceptions import (RetryError, MaxRetriesExceeded,
                          RetryTimeoutError, NotRetriableError)
 
+if PY_37:
+    def __getattr__(name):
+        # Lazily import asynchronous retrier on first use (PEP 562)
+        if name == 'AsyncRetrier':
+            from .async_retrier import AsyncRetrier
+            globals()[name] = AsyncRetrier
+            return AsyncRetrier
+
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name))
+else:  # pragma: no cover
+    from .async_retrier import AsyncRetrier  # noqa
+
 
 __author__ = 'Tomas Aparicio'
 __license__ = 'MIT'
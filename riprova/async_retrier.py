@@ -1,13 +1,12 @@
 # -*- coding: utf-8 -*-
 import asyncio  # noqa
-from six import raise_from
+import inspect
 from .backoff import Backoff
 from .retrier import Retrier
 from .errors import ErrorWhitelist
 from .strategies import ConstantBackoff
-from .exceptions import MaxRetriesExceeded, RetryError
-from riprova.constants import PY_310
-
+from .exceptions import MaxRetriesExceeded
+from riprova.constants import PY_310, PY_311
 
 
 class AsyncRetrier(Retrier):
@@ -19,12 +18,12 @@ class AsyncRetrier(Retrier):
     AsyncRetrier implements a synchronous and asynchronous context manager.
 
     Arguments:
-        timeout (int|float): maximum optional timeout in milliseconds.
+        timeout (int|float): maximum optional timeout in seconds.
             Use `None` for no limit. Defaults to `None`.
         backoff (riprova.Backoff): optional backoff strategy to use.
             Defaults to `riprova.ConstantBackoff`.
-        evaluator (function): optional evaluator function used to determine
-            when an operation should be retried or not.
+        evaluator (function|coroutinefunction): optional evaluator function
+            used to determine when an operation should be retried or not.
             This allow the developer to retry operations that do not raised
             any exception, for instance. Evaluator function accepts 1
             argument: the returned task result.
@@ -32,6 +31,7 @@ class AsyncRetrier(Retrier):
             simply return `True` in order to retry the operation.
             Otherwise the operation will be considered as valid and the
             retry loop will end.
+            Plain functions are called inline, without being awaited.
         error_evaluator (function|coroutinefunction): optional evaluator
             function used to determine when a task raised exception should
             be proccesed as legit error and therefore retried or, otherwise,
@@ -44,13 +44,15 @@ class AsyncRetrier(Retrier):
             simply return `True` in order to retry the operation.
             Otherwise the operation will be considered as valid and the
             retry loop will end.
-        on_retry (function): optional function to call on before very retry
-            operation. `on_retry` function accepts 2 arguments: `err, next_try`
-            and should return nothing.
+        on_retry (function|coroutinefunction): optional function to call on
+            before very retry operation. `on_retry` function accepts 2
+            arguments: `err, next_try` and should return nothing.
+            Plain functions are called inline, without being awaited.
         sleep_coro (coroutinefunction): optional coroutine function used to
             sleep. Defaults to `asyncio.sleep`.
-        loop (asyncio.BaseException): Deprecated.
-            Will always using `asyncio.get_event_loop()` in python 3.10 and above.
+        loop (asyncio.AbstractEventLoop): Deprecated.
+            Ignored in Python 3.10 and above. Defaults to the current event
+            loop at `run()` time.
 
     Attributes:
         whitelist (riprova.ErrorWhitelist): default error whitelist instance
@@ -68,15 +70,18 @@ class AsyncRetrier(Retrier):
             Defaults to `asyncio.sleep`.
         backoff (Backoff): stores current used backoff.
             Defaults to `riprova.ConstantBackoff`.
-        evaluator (coroutinefunction): stores the used evaluator function.
+        evaluator (function|coroutinefunction): stores the used evaluator
+            function.
             Defaults to `None`.
         error_evaluator (function|coroutinefunction): stores the used error
             evaluator function. Defaults to `self.is_whitelisted_error()`.
-        on_retry (coroutinefunction): stores the retry notifier function.
+        on_retry (function|coroutinefunction): stores the retry notifier
+            function.
             Defaults to `None`.
 
     Raises:
-        AssertionError: in case of invalid input params.
+        TypeError: in case of invalid input param types.
+        ValueError: in case of invalid input param values.
 
     Usage::
 
@@ -114,27 +119,30 @@ class AsyncRetrier(Retrier):
                  sleep_coro=None,
                  loop=None):
 
-        # Assert input params
+        # Validate input params
         if timeout is not None:
-            assert isinstance(timeout, (int, float)), 'timeout must be number'
-            assert timeout >= 0, 'timeout cannot be a negative number'
-
-        # Event loop to use
-        self.loop = loop or asyncio.get_event_loop()
+            if not isinstance(timeout, (int, float)):
+                raise TypeError('timeout must be number')
+            if timeout < 0:
+                raise ValueError('timeout cannot be a negative number')
+
+        # Optional event loop to use in Python < 3.10.
+        # Resolved lazily on run, if needed.
+        self.loop = loop
         # Stores number of retry attempts
         self.attempts = 0
         # Stores latest error
         self.error = None
-        # Maximum optional timeout in milliseconds. Use 0 for no limit
+        # Maximum optional timeout in seconds. Use None for no limit
         self.timeout = timeout or None
         # Stores optional evaluator function
-        self.evaluator = asyncio.coroutine(evaluator) if evaluator else None
+        self.evaluator = evaluator or None
         # Stores the error evaluator function.
         self.error_evaluator = error_evaluator or self.is_whitelisted_error
         # Stores optional coroutine function to call on before very
         # retry operation. `on_retry` function accepts 2 arguments:
         # `err, next_try` and should return nothing.
-        self.on_retry = asyncio.coroutine(on_retry) if on_retry else None
+        self.on_retry = on_retry or None
         # Backoff strategy to use. Defaults to `riprova.ConstantBackoff`.
         self.backoff = backoff or ConstantBackoff()
         # Function used to sleep. Defaults `asyncio.sleep()`.
@@ -144,30 +152,43 @@ class AsyncRetrier(Retrier):
                           AsyncRetrier.whitelist or
                           ErrorWhitelist())
 
+    async def _call_fast(self, coro, *args, **kw):
+        """
+        Calls the given coroutine function with the given variadic arguments,
+        without result evaluation.
+        """
+        res = await coro(*args, **kw)
+
+        # Clean error on success, if needed, and return response object
+        if self.error is not None:
+            self.error = None
+        return res
+
     async def _call(self, coro, *args, **kw):
         """
         Calls the given coroutine function with the given variadic arguments.
         """
-        res = await coro(*args, **kw)  # noqa (required for Python 2.x)
+        res = await coro(*args, **kw)
 
-        # If not evaluator function response is error
-        if not self.evaluator or res is None:
-            # Clean error on success
-            self.error = None
-            # Return response object
-            return res
+        # Use custom result evaluator, if present, in order to determine
+        # if the operation failed or not
+        err = None
+        if self.evaluator is not None and res is not None:
+            err = self.evaluator(res)
+            # Plain evaluator functions results are used inline
+            if inspect.isawaitable(err):
+                err = await err
 
-        # Use custom result evaluator in order to determine if the
-        # operation failed or not
-        err = await self.evaluator(res)
+        # Clean error on success, if needed, and return response object
         if not err:
-            self.error = None
+            if self.error is not None:
+                self.error = None
             return res
 
         # Raise custom error exception
         if isinstance(err, Exception):
             self.error = err
-            raise err from RetryError
+            raise err
 
         # If True, raise a custom exception
         if err is True:
@@ -176,29 +197,49 @@ class AsyncRetrier(Retrier):
         # Otherwise simply return the error object
         return err
 
-    async def _handle_error(self, err):
+    async def _evaluate_error(self, err):
         """
-        Handle execution error state and sleep the required amount of time.
+        Evaluates if the given error is legit and should be retried by using
+        the custom error evaluator function.
         """
-        # Update latest cached error
-        self.error = err
-
         # Defaults to false
         retry = True
 
         # Evaluate if error is legit or should be retried
         if self.error_evaluator:
-            retry = await (asyncio.coroutine(self.error_evaluator)(err))
+            retry = self.error_evaluator(err)
+            if inspect.isawaitable(retry):
+                retry = await retry
 
         # If evalutor returns an error exception, just raise it
         if retry and isinstance(retry, Exception):
-            raise_from(retry, self.error)
+            raise retry from self.error
 
         # If retry evaluator returns False, raise original error and
         # stop the retry cycle
         if retry is False:
             raise err
 
+    async def _handle_error(self, err, isretry=None):
+        """
+        Handle execution error state and sleep the required amount of time.
+
+        Arguments:
+            err (Exception): error raised by the task.
+            isretry (function): optional whitelist check to call instead of
+                the error evaluator, if the built-in one is used.
+        """
+        # Update latest cached error
+        self.error = err
+
+        # Built-in whitelist evaluation always returns a boolean
+        if isretry is not None:
+            # If error is whitelisted, raise it and stop the retry cycle
+            if not isretry(err):
+                raise err
+        else:
+            await self._evaluate_error(err)
+
         # Get delay before next retry
         delay = self.backoff.next()
 
@@ -208,9 +249,12 @@ class AsyncRetrier(Retrier):
 
         # Notify retry subscriber, if needed
         if self.on_retry:
-            await self.on_retry(err, delay)
+            notified = self.on_retry(err, delay)
+            if inspect.isawaitable(notified):
+                await notified
 
-        # Sleep before the next try attempt
+        # Sleep before the next try attempt. Backoff delays are already
+        # expressed in seconds, so no unit conversion is needed.
         await self.sleep(delay)
 
     async def _run(self, coro, *args, **kw):
@@ -218,26 +262,40 @@ class AsyncRetrier(Retrier):
         Runs coroutine in a error-safe infinitive loop until the
         operation succeed or the max retry attempts is reached.
         """
-        err = None
-
-        while True:
-            try:
-                return await self._call(coro, *args, **kw)
-
-            # Collect raised errors by cancelled futures
-            except asyncio.CancelledError as _err:
-                err = _err
-
-            # Handle any other exception error
-            except Exception as _err:
-                await self._handle_error(_err)
-
-            # Increment number of retry attempts
-            self.attempts += 1
-
-            # Forward raised exception, if needed
-            if err is not None:
-                raise err
+        # Use local references in the retry loop and only flush the
+        # attempts counter to the instance on exit
+        attempts = 0
+        _handle_error = self._handle_error
+
+        # Skip result evaluation entirely if no evaluator is defined
+        _call = self._call if self.evaluator is not None else self._call_fast
+
+        # Call the whitelist directly if the built-in error evaluator is used.
+        # Whitelist type checks are already memoized by error class.
+        isretry = None
+        if (self.error_evaluator == self.is_whitelisted_error and
+                type(self).is_whitelisted_error is
+                Retrier.is_whitelisted_error):
+            isretry = self.whitelist.isretry
+
+        try:
+            while True:
+                try:
+                    return await _call(coro, *args, **kw)
+
+                # Forward raised errors by cancelled futures
+                except asyncio.CancelledError:
+                    attempts += 1
+                    raise
+
+                # Handle any other exception error
+                except Exception as err:
+                    await _handle_error(err, isretry)
+
+                # Increment number of retry attempts
+                attempts += 1
+        finally:
+            self.attempts = attempts
 
     async def run(self, coro, *args, **kw):
         """
@@ -267,7 +325,21 @@ class AsyncRetrier(Retrier):
         self.error = None
         self.attempts = 0
 
-        # If not timeout defined, run the coroutine function
+        # If not timeout defined, run the coroutine function straight away
+        if self.timeout is None:
+            return await self._run(coro, *args, **kw)
+
+        return await self._run_with_timeout(coro, *args, **kw)
+
+    async def _run_with_timeout(self, coro, *args, **kw):
+        """
+        Runs the retry loop cancelling it if the timeout is exceeded.
+        """
+        # Use native timeout context manager, if available
+        if PY_311:
+            async with asyncio.timeout(self.timeout):
+                return await self._run(coro, *args, **kw)
+
         if PY_310:
             return await asyncio.wait_for(
                 self._run(coro, *args, **kw),
@@ -277,11 +349,12 @@ class AsyncRetrier(Retrier):
             return await asyncio.wait_for(
                 self._run(coro, *args, **kw),
                 self.timeout,
-                loop=self.loop
+                loop=self.loop or asyncio.get_event_loop()
             )
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback):
-        return self.__exit__(exc_type, exc_value, traceback)
+        # Forward error, if needed
+        return False
@@ -1,9 +1,30 @@
 # -*- coding: utf-8 -*-
 import abc
-from six import with_metaclass
+from .constants import INT_ERROR, NUM_ERROR, POS_ERROR
 
 
-class Backoff(with_metaclass(abc.ABCMeta, object)):
+def validate(name, value, types, positive=True):
+    """
+    Validates a backoff strategy input param value.
+
+    Arguments:
+        name (str): param name used in error messages.
+        value (mixed): param value to validate.
+        types (type|tuple[type]): expected param value types.
+        positive (bool): `True` if the value cannot be a negative number.
+
+    Raises:
+        TypeError: if the value is not an instance of the expected types.
+        ValueError: if the value is expected to be positive and it is not.
+    """
+    if not isinstance(value, types):
+        error = INT_ERROR if types is int else NUM_ERROR
+        raise TypeError(error.format(name))
+    if positive and value < 0:
+        raise ValueError(POS_ERROR.format(name))
+
+
+class Backoff(abc.ABC):
     """
     Backoff representing the minimum implementable interface
     by backoff strategies.
@@ -14,6 +35,8 @@ class Backoff(with_metaclass(abc.ABCMeta, object)):
     Backoff implementations are intended to be used in a single-thread context.
     """
 
+    __slots__ = ()
+
     # Flag used by backoff strategies to notify when the retry max attempts
     # were reached and they should stop.
     STOP = -1
@@ -24,6 +47,11 @@ class Backoff(with_metaclass(abc.ABCMeta, object)):
         Resets the current backoff state data.
 
         Backoff strategies must implement this method.
+
+        Backoff configuration is expected to be set once on construction,
+        so reset only restores the mutable running state, typically a few
+        plain attribute stores, and can be cheaply called on every new
+        retry cycle.
         """
 
     @abc.abstractmethod
@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 import sys
 
-# Store if Python runtime is higher or equal to 3.4
-PY_34 = sys.version_info >= (3, 4)
-PY_35 = sys.version_info >= (3, 5)
+# Store if Python runtime is higher or equal to a given version
+PY_37 = sys.version_info >= (3, 7)
 PY_310 = sys.version_info >= (3, 10)
+PY_311 = sys.version_info >= (3, 11)
 
 # Assertion template errors
 INT_ERROR = '{} param must be an int'
+NUM_ERROR = '{} param must be a number'
 POS_ERROR = '{} param must be a positive number'
@@ -15,6 +15,8 @@ class ErrorWhitelist(object):
         errors (list): list of whilelist errors.
     """
 
+    __slots__ = ('_list', '_frozen', '_tuple', '_cache')
+
     # Whitelist built-in exceptions that would be ignored by the retrier
     # engine. User can mutate and extend this list via class method.
     WHITELIST = set([
@@ -28,7 +30,11 @@ class ErrorWhitelist(object):
     ])
 
     def __init__(self, errors=None):
-        self._list = set(errors if errors else ErrorWhitelist.WHITELIST.copy())
+        # Copy the global whitelist only once, so it can be safely mutated
+        self._list = (set(errors) if errors
+                      else ErrorWhitelist.WHITELIST.copy())
+        # Cached whitelist data, refreshed on whitelist mutation
+        self._invalidate()
 
     @property
     def errors(self):
@@ -52,11 +58,13 @@ class ErrorWhitelist(object):
         if not isinstance(errors, (list, tuple)):
             raise TypeError('errors must be a list or tuple')
 
-        self._list = set()
+        # Validate all errors before replacing the current whitelist
         for err in errors:
-            if not issubclass(err, BaseException):
+            if not isinstance(err, type) or not issubclass(err, BaseException):
                 raise TypeError('error must be a subclass of Exception')
-            self._list.add(err)
+
+        self._list = set(errors)
+        self._invalidate()
 
     def add(self, *errors):
         """
@@ -65,12 +73,41 @@ class ErrorWhitelist(object):
         Arguments:
             *errors (Exception): variadic error classes to add.
         """
-        # Cache current whitelist
-        whitelist = self._list.copy()
-        # Delegate to attribute setter to run type validations
-        self.errors = errors
-        # Join whitelist with previous one
-        self._list = whitelist | self._list
+        # Validate all errors before mutating the current whitelist
+        for err in errors:
+            if not isinstance(err, type) or not issubclass(err, BaseException):
+                raise TypeError('error must be a subclass of Exception')
+
+        self._list.update(errors)
+        self._invalidate()
+
+    def _invalidate(self):
+        """
+        Refreshes cached whitelist data after a whitelist mutation.
+        """
+        # Whitelist snapshot used to detect in place mutations of `errors`
+        self._frozen = frozenset(self._list)
+        # Cached whitelist tuple used for fast subclass checks
+        self._tuple = tuple(self._frozen)
+        # Invalidate memoized error class evaluations
+        self._cache = {}
+
+    def _iswhitelisted(self, cls):
+        """
+        Checks if a given error class is a subclass of any whitelisted error.
+        Results are memoized per error class.
+
+        Returns:
+            bool
+        """
+        # The live errors set can be mutated in place by callers
+        if self._list != self._frozen:
+            self._invalidate()
+
+        whitelisted = self._cache.get(cls)
+        if whitelisted is None:
+            whitelisted = self._cache[cls] = issubclass(cls, self._tuple)
+        return whitelisted
 
     def isretry(self, error):
         """
@@ -79,11 +116,9 @@ class ErrorWhitelist(object):
         Returns:
             bool
         """
-        return not all([
-            error is not None,
-            any(isinstance(error, err) for err in self._list),
-            getattr(error, '__retry__', False) is False
-        ])
+        return not (error is not None and
+                    self._iswhitelisted(type(error)) and
+                    getattr(error, '__retry__', False) is False)
 
 
 class ErrorBlacklist(ErrorWhitelist):
@@ -101,6 +136,8 @@ class ErrorBlacklist(ErrorWhitelist):
         errors (list): list of blacklist errors.
     """
 
+    __slots__ = ()
+
     def isretry(self, error):
         """
         Checks if a given error object is not whitelisted.
@@ -108,7 +145,9 @@ class ErrorBlacklist(ErrorWhitelist):
         Returns:
             bool
         """
-        return not ErrorWhitelist.isretry(self, error)
+        return (error is not None and
+                self._iswhitelisted(type(error)) and
+                getattr(error, '__retry__', False) is False)
 
 
 def add_whitelist_error(*errors):
@@ -125,6 +164,6 @@ def add_whitelist_error(*errors):
 
         riprova.add_whitelist_error(MyCustomError, AnotherError)
     """
-    [ErrorWhitelist.WHITELIST.add(error)
-     for error in errors
-     if issubclass(error, BaseException)]
+    for error in errors:
+        if issubclass(error, BaseException):
+            ErrorWhitelist.WHITELIST.add(error)
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 import time
-from six import raise_from
 from .backoff import Backoff
 from .errors import ErrorWhitelist
 from .strategies import ConstantBackoff
@@ -18,7 +17,7 @@ class Retrier(object):
     Retrier object also implements a context manager.
 
     Arguments:
-        timeout (int): maximum optional timeout in milliseconds.
+        timeout (int|float): maximum optional timeout in seconds.
             Use `0` for no limit. Defaults to `0`.
         backoff (riprova.Backoff): optional backoff strategy to use.
             Defaults to `riprova.ConstantBackoff`.
@@ -73,7 +72,8 @@ class Retrier(object):
             Defaults to `None`.
 
     Raises:
-        AssertionError: in case of invalid input params.
+        TypeError: in case of invalid input param types.
+        ValueError: in case of invalid input param values.
 
     Usage::
 
@@ -123,16 +123,18 @@ class Retrier(object):
                  on_retry=None,
                  sleep_fn=None):
 
-        # Assert input params
+        # Validate input params
         if timeout is not None:
-            assert isinstance(timeout, (float, int)), 'timeout must be number'
-            assert timeout >= 0, 'timeout cannot be a negative number'
+            if not isinstance(timeout, (int, float)):
+                raise TypeError('timeout must be number')
+            if timeout < 0:
+                raise ValueError('timeout cannot be a negative number')
 
         # Stores number of retry attempts
         self.attempts = 0
         # Stores latest error
         self.error = None
-        # Maximum optional timeout in milliseconds. Use 0 for no limit
+        # Maximum optional timeout in seconds. Use 0 for no limit
         self.timeout = timeout or 0
         # Stores optional function to call on before very retry operation.
         # `on_retry` function accepts 2 arguments: `err, next_try` and
@@ -154,6 +156,18 @@ class Retrier(object):
     def is_whitelisted_error(self, err):
         return self.whitelist.isretry(err)
 
+    def _call_fast(self, fn, *args, **kw):
+        """
+        Calls the given function with the given variadic arguments,
+        without result evaluation.
+        """
+        res = fn(*args, **kw)
+
+        # Clean error on success, if needed, and return response object
+        if self.error is not None:
+            self.error = None
+        return res
+
     def _call(self, fn, *args, **kw):
         """
         Calls the given function with the given variadic arguments
@@ -176,12 +190,12 @@ class Retrier(object):
         # Raise custom error exception
         if isinstance(err, Exception):
             self.error = err
-            return raise_from(err, RetryError('retry loop error'))
+            raise err from RetryError('retry loop error')
 
         # If True, raise a custom exception
         if err is True:
             err = RetryError('retry evaluator assertion returned True')
-            return raise_from(err, self.error)
+            raise err from self.error
 
         # Otherwise simply return the error object
         return err
@@ -191,26 +205,29 @@ class Retrier(object):
         timeout_err = RetryTimeoutError('max timeout exceeded while retrying '
                                         'task: {}s'.format(self.timeout))
         # Raise timeout error
-        raise_from(timeout_err, self.error)
+        raise timeout_err from self.error
 
     def istimeout(self, start):
         """
         Verifies if the current timeout.
 
         Arguments:
-            start (int): start UNIX time in milliseconds.
+            start (float): start time in seconds, as returned by
+                `time.monotonic()`.
 
         Returns:
             bool: `True` if timeout exceeded, otherwise `False`.
         """
-        if self.timeout is None or self.timeout == 0:
+        if not self.timeout:
             return False
 
-        return time.time() - start > self.timeout > 0
+        return time.monotonic() > start + self.timeout
 
     def _handle_error(self, err):
         """
-        Handle execution error state and sleep the required amount of time.
+        Handles execution error state and evaluates if it should be retried.
+
+        `run()` inlines this logic, unless a subclass overrides this method.
         """
         # Update latest cached error
         self.error = err
@@ -224,7 +241,7 @@ class Retrier(object):
 
         # If evalutor returns an error exception, just raise it
         if retry and isinstance(retry, Exception):
-            raise_from(retry, self.error)
+            raise retry from self.error
 
         # If retry evaluator returns False, raise original error and
         # stop the retry cycle
@@ -232,18 +249,26 @@ class Retrier(object):
             raise err
 
     def _notify_subscriber(self, delay):
-        # Notify retry subscriber, if needed
+        """
+        Notifies the retry subscriber, if any, with the latest error.
+
+        `run()` inlines this logic, unless a subclass overrides this method.
+        """
         if self.on_retry:
             self.on_retry(self.error, delay)
 
     def _get_delay(self):
-        # Get delay before next retry
+        """
+        Returns the delay before the next retry, raising
+        `MaxRetriesExceeded` if the backoff strategy is done.
+
+        `run()` inlines this logic, unless a subclass overrides this method.
+        """
         delay = self.backoff.next()
 
         # If backoff is done, raise an exception
         if delay == Backoff.STOP:
-            return raise_from(MaxRetriesExceeded('max retries exceeded'),
-                              self.error)
+            raise MaxRetriesExceeded('max retries exceeded') from self.error
 
         return delay
 
@@ -273,34 +298,87 @@ class Retrier(object):
         # used in single thread environment.
         self.backoff.reset()
 
-        # Task initialization time for timeout tracking
-        start = time.time()
+        # Compute the task timeout deadline once, if needed
+        deadline = (time.monotonic() + self.timeout
+                    if self.timeout else None)
+
+        # Resolve bound methods and callbacks once, out of the retry loop
+        _call = self._call if self.evaluator else self._call_fast
+        error_evaluator, on_retry = self.error_evaluator, self.on_retry
+
+        # Call the whitelist directly if the built-in error evaluator is used.
+        # Whitelist type checks are already memoized by error class.
+        if (error_evaluator == self.is_whitelisted_error and
+                type(self).is_whitelisted_error is
+                Retrier.is_whitelisted_error):
+            error_evaluator = self.whitelist.isretry
+        next_delay, sleep = self.backoff.next, self.sleep
+        stop = Backoff.STOP
+
+        # Call the retry step methods instead of their inlined logic,
+        # if overridden by a subclass
+        cls = type(self)
+        handle_error = (self._handle_error
+                        if cls._handle_error is not Retrier._handle_error
+                        else None)
+        get_delay = (self._get_delay
+                     if cls._get_delay is not Retrier._get_delay
+                     else None)
+        notify_subscriber = (self._notify_subscriber
+                             if cls._notify_subscriber is not
+                             Retrier._notify_subscriber else None)
 
         # Run operation in a infinitive loop until the task succeeded or
         # and max retry attempts are reached.
         while True:
             # Ensure we do not exceeded the max timeout
-            if self.istimeout(start):
+            if deadline is not None and time.monotonic() > deadline:
                 return self._timeout_error()
 
             try:
                 # Try running the potential failed operation
-                return self._call(fn, *args, **kw)
+                return _call(fn, *args, **kw)
             except Exception as err:
-                # Handle error accordingly and re-raised whitelisted ones
-                self._handle_error(err)
+                if handle_error:
+                    handle_error(err)
+                else:
+                    # Update latest cached error
+                    self.error = err
+
+                    # Evaluate if error is legit or should be retried
+                    retry = error_evaluator(err) if error_evaluator else True
+
+                    # If evalutor returns an error exception, just raise it
+                    if retry and isinstance(retry, Exception):
+                        raise retry from err
+
+                    # If retry evaluator returns False, raise original error
+                    # and stop the retry cycle
+                    if retry is False:
+                        raise
 
             # Get delay before next try based on the configured backoff
-            delay = self._get_delay()
+            if get_delay:
+                delay = get_delay()
+            else:
+                delay = next_delay()
+
+                # If backoff is done, raise an exception
+                if delay == stop:
+                    raise MaxRetriesExceeded(
+                        'max retries exceeded') from self.error
 
             # Notify retry event subscriber, if needed
-            self._notify_subscriber(delay)
+            if notify_subscriber:
+                notify_subscriber(delay)
+            elif on_retry:
+                on_retry(self.error, delay)
 
             # Increment retry attempts
             self.attempts += 1
 
             # Sleep before next try
-            self.sleep(delay)
+            sleep(delay)
 
     def __enter__(self):
         # Reset state
@@ -1,23 +1,16 @@
 # -*- coding: utf-8 -*-
+import inspect
 import functools
-from .constants import PY_34
+import threading
 from .retrier import Retrier
-
-if PY_34:  # pragma: no cover
-    import asyncio
-    from .async_retrier import AsyncRetrier
-else:
-    asyncio, AsyncRetrier, partial = None, None, None
+from .errors import ErrorWhitelist
 
 
 def iscallable(x):
     """
     Returns `True` if the given value is a callable object.
     """
-    return any([
-        hasattr(x, '__call__'),
-        asyncio and asyncio.iscoroutinefunction(x)
-    ])
+    return callable(x)
 
 
 def retry(timeout=0, backoff=None, evaluator=None,
@@ -109,24 +102,79 @@ def retry(timeout=0, backoff=None, evaluator=None,
                             'function or a method.')
 
         # Resolve the required retrier instance
-        RetrierClass = (AsyncRetrier
-                        if asyncio and asyncio.iscoroutinefunction(fn)
-                        else Retrier)
+        if inspect.iscoroutinefunction(fn):
+            from .async_retrier import AsyncRetrier as RetrierClass
+        else:
+            RetrierClass = Retrier
 
         # Normalize potentially overloaded timeout param
         _timeout = timeout if decorated else 0
 
-        @functools.wraps(fn)
-        def wrapper(*args, **_kw):
-            # Otherwise return recursive currier function
-            retrier = RetrierClass(backoff=backoff,
-                                   timeout=_timeout,
-                                   evaluator=evaluator,
-                                   error_evaluator=error_evaluator,
-                                   on_retry=on_retry, **kw)
-
-            # Run original function via retry safe runner
-            return retrier.run(fn, *args, **_kw)
+        def new_retrier():
+            return RetrierClass(backoff=backoff,
+                                timeout=_timeout,
+                                evaluator=evaluator,
+                                error_evaluator=error_evaluator,
+                                on_retry=on_retry, **kw)
+
+        # Retrier instances are stateful, so a single instance is lazily
+        # created and reused across sequential calls, while concurrent calls
+        # (threads, recursion or interleaved coroutines) that find it busy
+        # fall back to a fresh instance.
+        state = {'retrier': None}
+        lock = threading.Lock()
+
+        def shared_retrier():
+            retrier = state['retrier']
+            if retrier is None:
+                retrier = state['retrier'] = new_retrier()
+            else:
+                refresh_whitelist(retrier)
+            return retrier
+
+        def refresh_whitelist(retrier):
+            # Retriers resolve the default error whitelist on construction,
+            # so pick up later changes to the class level lists or to the
+            # global whitelist, as a fresh retrier would do
+            whitelist = RetrierClass.blacklist or RetrierClass.whitelist
+            if whitelist is None:
+                current = retrier.whitelist
+                if (type(current) is ErrorWhitelist and
+                        current.errors == ErrorWhitelist.WHITELIST):
+                    return
+                whitelist = ErrorWhitelist()
+            retrier.whitelist = whitelist
+
+        def release():
+            # Drop the latest error, so the shared retrier does not keep its
+            # traceback frames and call arguments alive between calls
+            retrier = state['retrier']
+            if retrier is not None:
+                retrier.error = None
+            lock.release()
+
+        if RetrierClass is Retrier:
+            @functools.wraps(fn)
+            def wrapper(*args, **_kw):
+                if not lock.acquire(False):
+                    return new_retrier().run(fn, *args, **_kw)
+
+                # Run original function via retry safe runner
+                try:
+                    return shared_retrier().run(fn, *args, **_kw)
+                finally:
+                    release()
+        else:
+            @functools.wraps(fn)
+            async def wrapper(*args, **_kw):
+                if not lock.acquire(False):
+                    return await new_retrier().run(fn, *args, **_kw)
+
+                # Run original coroutine via retry safe runner
+                try:
+                    return await shared_retrier().run(fn, *args, **_kw)
+                finally:
+                    release()
 
         # Return retry wrapper function
         return wrapper
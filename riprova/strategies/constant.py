@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
-from ..backoff import Backoff
-from ..constants import INT_ERROR, POS_ERROR
+from ..backoff import Backoff, validate
+
+# Backoff stop sentinel, bound once at module level
+_STOP = Backoff.STOP
 
 
 class ConstantBackoff(Backoff):
@@ -23,7 +25,8 @@ class ConstantBackoff(Backoff):
             Use `0` for no limit. Defaults to `10`.
 
     Raises:
-        AssertionError: in case of invalid params.
+        TypeError: in case of invalid param types.
+        ValueError: in case of invalid param values.
 
     Usge::
 
@@ -32,11 +35,11 @@ class ConstantBackoff(Backoff):
             return x * x
     """
 
+    __slots__ = ('retries', 'pending_retries', 'interval')
+
     def __init__(self, interval=.1, retries=10):
-        assert isinstance(retries, int), INT_ERROR.format('retries')
-        assert isinstance(interval, (int, float)), INT_ERROR.format('interval')
-        assert retries >= 0, POS_ERROR.format('retries')
-        assert interval >= 0, POS_ERROR.format('interval')
+        validate('retries', retries, int)
+        validate('interval', interval, (int, float))
 
         self.retries = retries
         self.pending_retries = retries
@@ -57,12 +60,12 @@ class ConstantBackoff(Backoff):
         Returns:
             float: time to wait in seconds before the next try.
         """
-        # Verify we do not exceeded the max retries
-        if self.retries > 0 and self.pending_retries == 0:
-            return Backoff.STOP
-
-        # Decrement pending retries attempts
         if self.retries > 0:
+            # Verify we do not exceeded the max retries
+            if self.pending_retries == 0:
+                return _STOP
+
+            # Decrement pending retries attempts
             self.pending_retries -= 1
 
         # Return pending interval
@@ -1,8 +1,33 @@
 # -*- coding: utf-8 -*-
 import time
 import random
-from ..backoff import Backoff
-from ..constants import INT_ERROR, POS_ERROR
+from ..backoff import Backoff, validate
+from ..constants import PY_37
+
+# Backoff stop sentinel, bound once at module level
+_STOP = Backoff.STOP
+
+# Random number generator function, bound once at module level
+_random = random.random
+
+
+if PY_37:
+    # Integer nanoseconds clock, bound once at module level
+    _monotonic_ns = time.monotonic_ns
+
+    def now():
+        """
+        Returns the current monotonic clock time in milliseconds.
+        """
+        return _monotonic_ns() // 1000000
+else:
+    _monotonic = time.monotonic
+
+    def now():
+        """
+        Returns the current monotonic clock time in milliseconds.
+        """
+        return int(_monotonic() * 1000)
 
 
 class ExponentialBackOff(Backoff):
@@ -68,9 +93,16 @@ class ExponentialBackOff(Backoff):
             Defaults to `15` minutes == `15 * 60` seconds.
         multiplier (int|float): exponential multiplier.
             Defaults to `1.5`.
+        jitter (str): randomization strategy. Use `factor` to randomize
+            the interval within the `factor` range, `full` for a random
+            value between `0` and the interval, or `decorrelated` for a
+            random value between `interval` and three times the previous
+            delay, capped by `max_interval`, ignoring `multiplier`.
+            Defaults to `factor`.
 
     Raises:
-        AssertionError: in case of invalid params.
+        TypeError: in case of invalid param types.
+        ValueError: in case of invalid param values.
 
     Usage::
 
@@ -79,29 +111,69 @@ class ExponentialBackOff(Backoff):
             return x * x
     """
 
+    __slots__ = ('started', 'multiplier', 'max_elapsed', 'max_interval',
+                 'factor', 'interval', 'jitter', '_deadline', '_jitter_low',
+                 '_jitter_span', '_randomize', '_last', '_intervals',
+                 '_converged', '_attempt', '_series')
+
+    # Supported interval randomization strategies
+    JITTERS = ('factor', 'full', 'decorrelated')
+
+    # Interval randomization method names, by jitter strategy
+    _JITTER_METHODS = {
+        'factor': '_get_random_value',
+        'full': '_get_full_jitter_value',
+        'decorrelated': '_get_decorrelated_value',
+    }
+
     def __init__(self,
                  interval=.5,
                  factor=0.5,
                  max_interval=60,
                  max_elapsed=15 * 60,
-                 multiplier=1.5):
-
-        # Assert valid params
-        assert isinstance(interval, (int, float)), INT_ERROR.format('interval')
-        assert isinstance(multiplier, (int, float)), INT_ERROR.format('multiplier')  # noqa
-        assert isinstance(factor, (int, float)), INT_ERROR.format('factor')
-        assert isinstance(max_elapsed, (int, float)), INT_ERROR.format('max_elapsed') # noqa
-        assert isinstance(max_interval, int), INT_ERROR.format('max_interval')
-        assert interval >= 0, POS_ERROR.format('interval')
-        assert multiplier >= 0, POS_ERROR.format('multiplier')
-
-        self.started = None  # start time in seconds
+                 multiplier=1.5,
+                 jitter='factor'):
+
+        # Validate input params
+        validate('interval', interval, (int, float))
+        validate('multiplier', multiplier, (int, float))
+        validate('factor', factor, (int, float), positive=False)
+        validate('max_elapsed', max_elapsed, (int, float), positive=False)
+        validate('max_interval', max_interval, int, positive=False)
+        if jitter not in self.JITTERS:
+            raise ValueError('invalid jitter: {}'.format(jitter))
+
         self.multiplier = multiplier
         self.max_elapsed = int(max_elapsed * 1000)
         self.max_interval = int(max_interval * 1000)
         self.factor = min(max(factor, 0), 1)
         self.interval = int(interval * 1000)
-        self.current_interval = self.interval
+        self.jitter = jitter
+
+        # Configuration of the memoized intervals series, if any
+        self._series = None
+
+        # Initialize running state and configuration derived data
+        self.reset()
+
+    @property
+    def current_interval(self):
+        """
+        Returns the current non-randomized interval in milliseconds.
+        """
+        return self._interval(self._attempt)
+
+    @current_interval.setter
+    def current_interval(self, interval):
+        """
+        Sets the current non-randomized interval in milliseconds, growing
+        the next intervals from it.
+        """
+        self._intervals = [interval]
+        self._converged = False
+        self._attempt = 0
+        # Rebuild the intervals series from `interval` on reset
+        self._series = None
 
     @property
     def elapsed(self):
@@ -109,15 +181,38 @@ class ExponentialBackOff(Backoff):
         Returns the elapsed time since an `ExponentialBackOff` instance
         is created and is reset when `reset()` is called.
         """
-        return int(time.time() * 1000) - self.started
+        return now() - self.started
 
     def reset(self):
         """
         Reset the interval back to the initial retry interval and
         restarts the timer.
+
+        Configuration changes, such as `interval`, `multiplier`,
+        `max_interval`, `factor` or `jitter`, take effect on reset, which
+        retriers call before every run.
         """
-        self.started = None
-        self.current_interval = self.interval
+        self.started = None  # start monotonic time in milliseconds
+        self._deadline = None  # max elapsed monotonic time in milliseconds
+        self._attempt = 0  # current retry attempt
+
+        # Randomization range lower bound and span, as interval multipliers
+        self._jitter_low = 1 - self.factor
+        self._jitter_span = 2 * self.factor
+
+        # Interval randomization function, based on the jitter strategy
+        self._randomize = getattr(self, self._JITTER_METHODS[self.jitter])
+        # Latest randomized interval, used by decorrelated jitter
+        self._last = self.interval
+
+        # Memoized capped exponential intervals series, indexed by attempt.
+        # The series is lazily grown and preserved across resets, unless
+        # its configuration changed.
+        series = (self.interval, self.multiplier, self.max_interval)
+        if series != self._series:
+            self._series = series
+            self._intervals = [self.interval]
+            self._converged = False
 
     def next(self):
         """
@@ -128,51 +223,113 @@ class ExponentialBackOff(Backoff):
         Returns:
             int: time to wait in seconds before the next try.
         """
-        # Store start time
+        # Store start time and max elapsed time deadline, if needed
         if self.started is None:
-            self.started = int(time.time() * 1000)
+            self.started = now()
+            if self.max_elapsed != 0:
+                self._deadline = self.started + self.max_elapsed
 
         # Make sure we have not gone over the maximum elapsed time.
-        if self.max_elapsed != 0 and self.elapsed > self.max_elapsed:
-            return Backoff.STOP
+        elif self._deadline is not None and now() > self._deadline:
+            return _STOP
+
+        # Get the memoized interval for the current attempt
+        attempt = self._attempt
+        intervals = self._intervals
+        if attempt < len(intervals):
+            current = intervals[attempt]
+        else:
+            current = self._interval(attempt)
 
         # Get random exponential interval
-        interval = self._get_random_value()
+        interval = self._randomize(current)
 
         # Incremental interval
-        self._increment_interval()
+        self._attempt = attempt + 1
 
         # Return interval
         return round(interval / 1000, 2)
 
-    def _increment_interval(self):
+    def peek(self, n):
         """
-        Increments the current interval by multiplying it with the multiplier.
+        Returns the non-randomized interval in seconds for the retry
+        attempt `n` positions ahead of the current one, without consuming
+        retry attempts.
+
+        Arguments:
+            n (int): number of retry attempts ahead, where `0` is the
+                current attempt.
+
+        Raises:
+            ValueError: if `n` is a negative number.
+
+        Returns:
+            int|float: interval in seconds, capped by `max_interval`.
         """
-        # Check for overflow, if overflow is detected set the current
-        # interval to the max interval.
-        if self.current_interval >= (self.max_interval / self.multiplier):
-            self.current_interval = self.max_interval
-        else:
-            self.current_interval = self.current_interval * self.multiplier
+        if n < 0:
+            raise ValueError('n cannot be a negative number')
+
+        return round(self._interval(self._attempt + n) / 1000, 2)
+
+    def _interval(self, attempt):
+        """
+        Returns the capped exponential interval for the given attempt,
+        growing the memoized intervals series, if needed.
+        """
+        intervals = self._intervals
+        while attempt >= len(intervals) and not self._converged:
+            current = intervals[-1]
+            interval = self._increment_interval(current)
+            if interval == current:
+                self._converged = True
+            else:
+                intervals.append(interval)
+
+        return intervals[min(attempt, len(intervals) - 1)]
+
+    def _increment_interval(self, current):
+        """
+        Returns the given interval multiplied by the multiplier.
+        """
+        # Check for overflow, if overflow is detected return the max interval
+        if current * self.multiplier >= self.max_interval:
+            return self.max_interval
+        return current * self.multiplier
 
-    def _get_random_value(self):
+    def _get_random_value(self, current):
         """
         Returns a random value from the following interval:
 
-            [factor * current_interval, factor * current_interval]
+            [current_interval * (1 - factor), current_interval * (1 + factor)]
 
         Returns:
-            int: interval seconds to wait before next try.
+            int: interval milliseconds to wait before next try.
         """
-        rand = random.random()
-        delta = self.factor * rand
+        return int(current * (self._jitter_low +
+                              self._jitter_span * _random()))
 
-        min_interval = self.current_interval - delta
-        max_interval = self.current_interval + delta
+    def _get_full_jitter_value(self, current):
+        """
+        Returns a random value from the following interval:
+
+            [0, current_interval]
+
+        Returns:
+            int: interval milliseconds to wait before next try.
+        """
+        return int(current * _random())
 
-        # Get a random value from the range [min_interval, max_interval].
-        # The formula used below has a +1 because if the min_interval is 1 and
-        # the max_interval is 3 then we want a 33% chance for selecting either
-        # 1, 2 or 3.
-        return int(min_interval + (rand * (max_interval - min_interval + 1)))
+    def _get_decorrelated_value(self, current):
+        """
+        Returns a random value from the following interval, capped by
+        `max_interval`:
+
+            [interval, previous interval * 3]
+
+        Returns:
+            int: interval milliseconds to wait before next try.
+        """
+        interval = self.interval
+        interval += int(_random() * (self._last * 3 - interval))
+        self._last = interval = min(interval, self.max_interval)
+        return interval
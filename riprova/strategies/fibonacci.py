@@ -1,6 +1,35 @@
 # -*- coding: utf-8 -*-
-from ..backoff import Backoff
-from ..constants import INT_ERROR, POS_ERROR
+from ..backoff import Backoff, validate
+
+# Backoff stop sentinel, bound once at module level
+_STOP = Backoff.STOP
+
+# Precomputed Fibonacci series numbers, shared across backoff instances
+_SERIES = [0, 1]
+while len(_SERIES) < 100:
+    _SERIES.append(_SERIES[-1] + _SERIES[-2])
+_SERIES = tuple(_SERIES)
+
+
+def fibonacci(n):
+    """
+    Returns the Fibonacci series number at the given position, starting
+    from `0`.
+
+    Arguments:
+        n (int): series number position.
+
+    Returns:
+        int
+    """
+    if n < len(_SERIES):
+        return _SERIES[n]
+
+    # Compute numbers out of the precomputed series, if ever needed
+    prev, current = _SERIES[-2], _SERIES[-1]
+    for _ in range(n - len(_SERIES) + 1):
+        prev, current = current, prev + current
+    return current
 
 
 class FibonacciBackoff(Backoff):
@@ -27,7 +56,8 @@ class FibonacciBackoff(Backoff):
             Defaults to `1`.
 
     Raises:
-        AssertionError: in case of invalid params.
+        TypeError: in case of invalid param types.
+        ValueError: in case of invalid param values.
 
     Usage::
 
@@ -36,21 +66,37 @@ class FibonacciBackoff(Backoff):
             return x * x
     """
 
+    __slots__ = ('retries', 'initial', 'max_retries', 'multiplier',
+                 '_retries_limit', '_index')
+
     def __init__(self, retries=10, initial=1, multiplier=1):
         # Validate input params
-        assert isinstance(retries, int), INT_ERROR.format('retries')
-        assert isinstance(initial, int), INT_ERROR.format('initial')
-        assert isinstance(multiplier, int), INT_ERROR.format('multiplier')
-        assert retries >= 0, POS_ERROR.format('retries')
-        assert initial >= 0, POS_ERROR.format('initial')
-        assert multiplier >= 0, POS_ERROR.format('multiplier')
-
-        self.prev = 0
+        validate('retries', retries, int)
+        validate('initial', initial, int)
+        validate('multiplier', multiplier, int)
+
         self.retries = 0
-        self.current = initial or 1
-        self.initial = self.current
+        self.initial = initial or 1
         self.max_retries = retries
+        # Effective max retries limit, which is infinite if no limit is set
+        self._retries_limit = retries if retries > 0 else float('inf')
         self.multiplier = multiplier
+        # Current position in the Fibonacci series
+        self._index = 0
+
+    @property
+    def prev(self):
+        """
+        Returns the previous number in the Fibonacci series.
+        """
+        return fibonacci(self._index) * self.initial
+
+    @property
+    def current(self):
+        """
+        Returns the current number in the Fibonacci series.
+        """
+        return fibonacci(self._index + 1) * self.initial
 
     @property
     def interval(self):
@@ -58,19 +104,25 @@ class FibonacciBackoff(Backoff):
         Returns the next Fibonacci number in the series, multiplied by
         the current configured multiplier, typically `100`, for time
         seconds adjust.
+
+        Note: reading this property advances the series.
+        """
+        return self._next_interval()
+
+    def _next_interval(self):
+        """
+        Advances the Fibonacci series and returns the new current number
+        multiplied by the configured multiplier.
         """
-        current = self.prev + self.current
-        self.prev = self.current
-        self.current = current
-        return self.current * self.multiplier
+        self._index = index = self._index + 1
+        return fibonacci(index + 1) * self.initial * self.multiplier
 
     def reset(self):
         """
         Resets the current backoff state data.
         """
-        self.prev = 0
         self.retries = 0
-        self.current = self.initial
+        self._index = 0
 
     def next(self):
         """
@@ -82,12 +134,11 @@ class FibonacciBackoff(Backoff):
             float: time to wait in seconds before the next try.
         """
         # Verify we do not exceeded the max retries
-        if self.max_retries > 0 and self.retries >= self.max_retries:
-            return Backoff.STOP
+        if self.retries >= self._retries_limit:
+            return _STOP
 
-        # Decrement pending retries attempts
-        if self.max_retries > 0:
-            self.retries += 1
+        # Increment retries attempts
+        self.retries += 1
 
         # Return next interval according to Fibonacci series
-        return self.interval
+        return self._next_interval()
@@ -1,20 +1,19 @@
 # -*- coding: utf-8 -*-
 import time
+import asyncio
 import pytest
-from riprova import ConstantBackoff, MaxRetriesExceeded
-from riprova.constants import PY_35
+from riprova import AsyncRetrier, ConstantBackoff, MaxRetriesExceeded
+from riprova.constants import PY_37
 
-try:
-    import asyncio
-    from riprova import AsyncRetrier
-except Exception:
-    asyncio, AsyncRetrier = None, None
 
+async def noop_sleep(delay):
+    pass
 
-if PY_35:
-    @pytest.fixture
-    def coro():
-        scope = {'calls': 0, 'times': 0}
+
+@pytest.fixture(scope='module')
+def coro():
+    def setup(times=0):
+        scope = {'calls': 0, 'times': times}
 
         async def task(x, y, foo=0):
             scope['calls'] += 1
@@ -22,19 +21,9 @@ if PY_35:
                 raise RuntimeError('invalid call')
             return x + y + foo
 
-        def setup(times=0):
-            scope['times'] = times
-            return task
-
-        return setup
+        return task
 
-    def run_coro(coro):
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(coro)
-else:
-    @pytest.fixture
-    def coro():
-        pass
+    return setup
 
 
 def test_async_retrier_defaults():
@@ -68,14 +57,48 @@ def test_async_retrier_custom():
     assert retrier.backoff == backoff
 
 
+def test_async_retrier_sync_callables(MagicMock, coro, run_coro):
+    on_retry = MagicMock()
+    evaluator = MagicMock(return_value=False)
+
+    retrier = AsyncRetrier(on_retry=on_retry, evaluator=evaluator,
+                           sleep_coro=noop_sleep)
+    assert retrier.on_retry is on_retry
+    assert retrier.evaluator is evaluator
+
+    res = run_coro(retrier.run(coro(2), 2, 4))
+    assert res == 6
+    assert on_retry.call_count == 1
+    assert evaluator.call_count == 1
+
+
+def test_async_retrier_reassigned_coroutine_callables(coro, run_coro):
+    calls = []
+
+    async def on_retry(err, delay):
+        calls.append('on_retry')
+
+    async def evaluator(res):
+        calls.append('evaluator')
+        return False
+
+    retrier = AsyncRetrier(sleep_coro=noop_sleep)
+    retrier.on_retry = on_retry
+    retrier.evaluator = evaluator
+
+    res = run_coro(retrier.run(coro(2), 2, 4))
+    assert res == 6
+    assert calls == ['on_retry', 'evaluator']
+
+
 def test_async_retrier_assestion_error():
-    with pytest.raises(AssertionError):
+    with pytest.raises(TypeError):
         AsyncRetrier(timeout='foo')
-    with pytest.raises(AssertionError):
+    with pytest.raises(ValueError):
         AsyncRetrier(timeout=-1)
 
 
-def test_async_retrier_run_success(MagicMock, coro):
+def test_async_retrier_run_success(MagicMock, coro, run_coro):
     on_retry = MagicMock()
     retrier = AsyncRetrier(on_retry=on_retry)
 
@@ -87,7 +110,7 @@ def test_async_retrier_run_success(MagicMock, coro):
     assert retrier.error is None
 
 
-def test_async_retrier_run_valid_retries(MagicMock, coro):
+def test_async_retrier_run_valid_retries(MagicMock, coro, run_coro):
     task = coro(4)
     on_retry = MagicMock()
 
@@ -99,7 +122,7 @@ def test_async_retrier_run_valid_retries(MagicMock, coro):
     assert retrier.error is None
 
 
-def test_async_retrier_evaluator(MagicMock, coro):
+def test_async_retrier_evaluator(MagicMock, coro, run_coro):
     on_retry = MagicMock()
     task = coro(4)
 
@@ -109,6 +132,7 @@ def test_async_retrier_evaluator(MagicMock, coro):
         return False
 
     retrier = AsyncRetrier(evaluator=evaluator, on_retry=on_retry,
+                           sleep_coro=noop_sleep,
                            backoff=ConstantBackoff(interval=0, retries=10))
 
     res = run_coro(retrier.run(task, 2, 4, foo=6))
@@ -121,7 +145,7 @@ def test_async_retrier_evaluator(MagicMock, coro):
     assert retrier.error is None
 
 
-def test_async_retrier_evaluator_error_default(MagicMock, coro):
+def test_async_retrier_evaluator_error_default(MagicMock, coro, run_coro):
     on_retry = MagicMock()
     task = coro(4)
 
@@ -131,6 +155,7 @@ def test_async_retrier_evaluator_error_default(MagicMock, coro):
         raise ImportError('pass error')
 
     retrier = AsyncRetrier(evaluator=evaluator, on_retry=on_retry,
+                           sleep_coro=noop_sleep,
                            backoff=ConstantBackoff(interval=0, retries=10))
 
     with pytest.raises(ImportError):
@@ -143,7 +168,59 @@ def test_async_retrier_evaluator_error_default(MagicMock, coro):
     assert isinstance(retrier.error, ImportError)
 
 
-def test_async_retrier_cancelled_error(MagicMock, coro):
+def test_async_retrier_evaluator_error_instance(coro, run_coro):
+    task = coro(0)
+
+    async def evaluator(x):
+        return ImportError('pass error')
+
+    retrier = AsyncRetrier(evaluator=evaluator)
+
+    with pytest.raises(ImportError) as excinfo:
+        run_coro(retrier.run(task, 2, 4, foo=6))
+
+    assert excinfo.value.__cause__ is None
+    assert retrier.attempts == 0
+    assert retrier.error is excinfo.value
+
+
+def test_async_retrier_error_evaluator_coroutine(MagicMock, coro, run_coro):
+    on_retry = MagicMock()
+    task = coro(4)
+
+    async def error_evaluator(err):
+        return isinstance(err, RuntimeError)
+
+    retrier = AsyncRetrier(error_evaluator=error_evaluator,
+                           on_retry=on_retry,
+                           sleep_coro=noop_sleep,
+                           backoff=ConstantBackoff(interval=0, retries=10))
+
+    res = run_coro(retrier.run(task, 2, 4, foo=6))
+    assert res == 12
+
+    assert on_retry.call_count == 3
+    assert retrier.attempts == 3
+    assert retrier.error is None
+
+
+def test_async_retrier_reassigned_error_evaluator(run_coro):
+    scope = {'calls': 0}
+
+    async def task():
+        scope['calls'] += 1
+        raise RuntimeError('invalid call')
+
+    retrier = AsyncRetrier(sleep_coro=noop_sleep,
+                           backoff=ConstantBackoff(interval=0, retries=10))
+    retrier.error_evaluator = lambda err: False
+
+    with pytest.raises(RuntimeError):
+        run_coro(retrier.run(task))
+    assert scope['calls'] == 1
+
+
+def test_async_retrier_cancelled_error(MagicMock, coro, run_coro):
     on_retry = MagicMock()
 
     async def coro(x):
@@ -152,6 +229,7 @@ def test_async_retrier_cancelled_error(MagicMock, coro):
         raise asyncio.CancelledError('oops')
 
     retrier = AsyncRetrier(on_retry=on_retry,
+                           sleep_coro=noop_sleep,
                            backoff=ConstantBackoff(interval=0, retries=10))
 
     with pytest.raises(asyncio.CancelledError):
@@ -164,11 +242,31 @@ def test_async_retrier_cancelled_error(MagicMock, coro):
     assert retrier.error is not None
 
 
-def test_async_retrier_run_max_retries_error(MagicMock, coro):
+def test_async_retrier_timeout_error_retried(MagicMock, run_coro):
+    on_retry = MagicMock()
+    calls = {'count': 0}
+
+    async def coro():
+        calls['count'] += 1
+        if calls['count'] < 3:
+            raise asyncio.TimeoutError('task timeout')
+        return calls['count']
+
+    retrier = AsyncRetrier(on_retry=on_retry,
+                           sleep_coro=noop_sleep,
+                           backoff=ConstantBackoff(interval=0, retries=10))
+
+    assert run_coro(retrier.run(coro)) == 3
+    assert on_retry.call_count == 2
+    assert retrier.attempts == 2
+
+
+def test_async_retrier_run_max_retries_error(MagicMock, coro, run_coro):
     on_retry = MagicMock()
     task = coro(10)
 
     retrier = AsyncRetrier(on_retry=on_retry,
+                           sleep_coro=noop_sleep,
                            backoff=ConstantBackoff(interval=0, retries=2))
 
     with pytest.raises(MaxRetriesExceeded):
@@ -181,11 +279,13 @@ def test_async_retrier_run_max_retries_error(MagicMock, coro):
     assert isinstance(retrier.error, RuntimeError)
 
 
-def test_async_retrier_run_max_timeout(MagicMock, coro):
+def test_async_retrier_run_max_timeout(MagicMock, coro, run_coro,
+                                       loop_clock):
     on_retry = MagicMock()
     task = coro(10)
 
     retrier = AsyncRetrier(timeout=.25, on_retry=on_retry,
+                           sleep_coro=loop_clock.async_sleep,
                            backoff=ConstantBackoff(interval=.1))
 
     with pytest.raises(asyncio.TimeoutError):
@@ -194,18 +294,41 @@ def test_async_retrier_run_max_timeout(MagicMock, coro):
     assert on_retry.called
     assert on_retry.call_count == 3
 
-    assert retrier.attempts >= 1
-    assert retrier.attempts < 4
+    assert retrier.attempts == 2
     assert isinstance(retrier.error, RuntimeError)
 
 
+@pytest.mark.skipif(not PY_37, reason='requires Python 3.7+')
+def test_async_retrier_run_no_timeout_task(run_coro):
+    retrier = AsyncRetrier()
+
+    async def task():
+        return asyncio.current_task()
+
+    async def run():
+        return asyncio.current_task(), await retrier.run(task)
+
+    # Without timeout, the retry loop runs in the caller task
+    outer, inner = run_coro(run())
+    assert outer is inner
+
+
 def test_async_retrier_istimeout():
     assert AsyncRetrier().istimeout(1234) is False
 
-    now = time.time() - 100
+    now = time.monotonic() - 100
     assert AsyncRetrier(timeout=1).istimeout(now) is True
 
 
-def test_async_retrier_context_manager(MagicMock, coro):
+def test_async_retrier_context_manager(MagicMock, coro, run_coro):
     from .async_retrier_context import test_async_retrier_context_manager
     test_async_retrier_context_manager(MagicMock, coro, run_coro)
+
+
+def test_async_retrier_context_manager_forward_error(run_coro):
+    async def run_context():
+        async with AsyncRetrier():
+            raise RuntimeError('Error message here.')
+
+    with pytest.raises(RuntimeError, match=r'^Error message here\.$'):
+        run_coro(run_context())
@@ -1,10 +1,84 @@
+import os
+import asyncio
 import pytest
+import riprova.retrier
+from unittest.mock import MagicMock as _MagicMock
 
 
-@pytest.fixture(scope='session', autouse=True)
+@pytest.fixture(scope='session')
 def MagicMock():
+    return _MagicMock
+
+
+def new_event_loop():
+    # Optionally use uvloop, if enabled and available
+    if os.environ.get('RIPROVA_TEST_UVLOOP') == '1':
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.new_event_loop()
+
+    return asyncio.new_event_loop()
+
+
+@pytest.fixture(scope='session')
+def event_loop():
+    loop = new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    asyncio.set_event_loop(None)
+    loop.close()
+
+
+@pytest.fixture
+def run_coro(event_loop):
+    return event_loop.run_until_complete
+
+
+class VirtualClock(object):
+    """
+    Deterministic monotonic clock that only moves forward when sleeping.
+    """
+
+    def __init__(self, now=0):
+        self.now = now
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, delay):
+        self.now += delay
+
+    async def async_sleep(self, delay):
+        self.now += delay
+
+        def resume():
+            if not future.done():
+                future.set_result(None)
+
+        # Resume two loop iterations later, once due timers and the
+        # callbacks scheduled by them, such as task cancellations, have run
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        loop.call_soon(loop.call_soon, resume)
+        await future
+
+
+@pytest.fixture
+def clock(monkeypatch, event_loop):
+    clock = VirtualClock(event_loop.time())
+    # Retrier reads the clock and sleeps via the time module
+    monkeypatch.setattr(riprova.retrier, 'time', clock)
+    return clock
+
+
+@pytest.fixture
+def loop_clock(monkeypatch, event_loop, clock):
+    # Drive event loop timers, such as task timeouts, by the virtual clock
     try:
-        from unittest.mock import MagicMock
-    except Exception as error:  # noqa
-        from mock import MagicMock
-    return MagicMock
+        monkeypatch.setattr(event_loop, 'time', clock.monotonic)
+    except AttributeError:
+        pytest.skip('event loop clock cannot be patched')
+    return clock
@@ -1,10 +1,13 @@
 # -*- coding: utf-8 -*-
-from riprova.constants import INT_ERROR, POS_ERROR
+from riprova.constants import INT_ERROR, NUM_ERROR, POS_ERROR
 
 
 def test_constants():
     assert isinstance(INT_ERROR, str)
     assert INT_ERROR.format('foo') == 'foo param must be an int'
 
+    assert isinstance(NUM_ERROR, str)
+    assert NUM_ERROR.format('foo') == 'foo param must be a number'
+
     assert isinstance(POS_ERROR, str)
     assert POS_ERROR.format('foo') == 'foo param must be a positive number'
@@ -39,6 +39,12 @@ def test_error_whitelist_invalid():
     with pytest.raises(TypeError):
         whitelist.add(dict())
 
+    # Failed additions must not mutate the whitelist
+    errors = whitelist.errors.copy()
+    with pytest.raises(TypeError):
+        whitelist.add(RuntimeError, None)
+    assert whitelist.errors == errors
+
 
 class NoRetryError(NotRetriableError):
     pass
@@ -48,23 +54,80 @@ class RetryError(NotRetriableError):
     __retry__ = True
 
 
-@pytest.mark.parametrize("error,expected", [
-    (SystemExit(), False),
-    (ImportError(), False),
-    (ReferenceError(), False),
-    (SyntaxError(), False),
-    (KeyboardInterrupt(), False),
-    (NotRetriableError(), False),
-    (NoRetryError(), False),
-    (ReferenceError(), False),
-    (RetryError(), True),
-    (Exception(), True),
-    (RuntimeError(), True),
-    (TypeError(), True),
-    (ValueError(), True),
-])
-def test_error_whitelist_isretry(error, expected):
-    assert ErrorWhitelist().isretry(error) is expected
+# Error cases as `(error, whitelist isretry, blacklist isretry)` tuples
+ERROR_CASES = (
+    (SystemExit(), False, True),
+    (ImportError(), False, True),
+    (ReferenceError(), False, True),
+    (SyntaxError(), False, True),
+    (KeyboardInterrupt(), False, True),
+    (NotRetriableError(), False, True),
+    (NoRetryError(), False, True),
+    (RetryError(), True, False),
+    (Exception(), True, False),
+    (RuntimeError(), True, False),
+    (TypeError(), True, False),
+    (ValueError(), True, False),
+)
+
+
+@pytest.fixture(scope='module')
+def error_lists():
+    return ErrorWhitelist(), ErrorBlacklist()
+
+
+@pytest.mark.parametrize('error,whitelisted,blacklisted', ERROR_CASES,
+                         ids=[type(case[0]).__name__ for case in ERROR_CASES])
+def test_error_list_isretry(error_lists, error, whitelisted, blacklisted):
+    whitelist, blacklist = error_lists
+    assert whitelist.isretry(error) is whitelisted
+    assert blacklist.isretry(error) is blacklisted
+
+
+def test_error_list_isretry_instance_flag(error_lists):
+    whitelist, blacklist = error_lists
+    error = NoRetryError()
+    error.__retry__ = True
+    assert whitelist.isretry(error) is True
+    assert blacklist.isretry(error) is False
+
+
+def test_error_whitelist_isretry_mutation():
+    whitelist = ErrorWhitelist()
+    assert whitelist.isretry(RuntimeError()) is True
+
+    whitelist.add(RuntimeError)
+    assert whitelist.isretry(RuntimeError()) is False
+
+    whitelist.errors = (ValueError,)
+    assert whitelist.isretry(RuntimeError()) is True
+    assert whitelist.isretry(ValueError()) is False
+
+
+def test_error_whitelist_errors_mutation():
+    whitelist = ErrorWhitelist()
+    assert whitelist.isretry(RuntimeError()) is True
+
+    # In place mutations of the errors set must not use stale lookups
+    whitelist.errors.add(RuntimeError)
+    assert whitelist.isretry(RuntimeError()) is False
+
+    whitelist.errors.discard(RuntimeError)
+    assert whitelist.isretry(RuntimeError()) is True
+
+
+def test_error_whitelist_errors_setter_invalid():
+    whitelist = ErrorWhitelist()
+    assert whitelist.isretry(ImportError()) is False
+    assert whitelist.isretry(ValueError()) is True
+
+    # Failed assignments must not replace the whitelist
+    errors = whitelist.errors.copy()
+    with pytest.raises(TypeError):
+        whitelist.errors = [ValueError, 'x']
+    assert whitelist.errors == errors
+    assert whitelist.isretry(ImportError()) is False
+    assert whitelist.isretry(ValueError()) is True
 
 
 def test_error_blacklist():
@@ -87,25 +150,6 @@ def test_error_blacklist():
                                     BaseException, SystemExit])
 
 
-@pytest.mark.parametrize("error,expected", [
-    (SystemExit(), True),
-    (ImportError(), True),
-    (ReferenceError(), True),
-    (SyntaxError(), True),
-    (KeyboardInterrupt(), True),
-    (NotRetriableError(), True),
-    (NoRetryError(), True),
-    (ReferenceError(), True),
-    (RetryError(), False),
-    (Exception(), False),
-    (RuntimeError(), False),
-    (TypeError(), False),
-    (ValueError(), False),
-])
-def test_error_blacklist_isretry(error, expected):
-    assert ErrorBlacklist().isretry(error) is expected
-
-
 def test_add_whitelist_error():
     whitelist = ErrorWhitelist.WHITELIST.copy()
 
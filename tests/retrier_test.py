@@ -1,8 +1,17 @@
 # -*- coding: utf-8 -*-
 import time
 import pytest
-from riprova import (Retrier, ConstantBackoff,
-                     MaxRetriesExceeded, RetryTimeoutError)
+from riprova import (Retrier, Backoff, ConstantBackoff, FibonacciBackoff,
+                     ExponentialBackOff, MaxRetriesExceeded,
+                     RetryTimeoutError)
+
+
+# Errors retried by the custom error evaluator tests
+RETRYABLE_ERRORS = (ValueError, RuntimeError, SyntaxError)
+
+
+def noop_sleep(delay):
+    pass
 
 
 def test_retrier_defaults():
@@ -36,9 +45,9 @@ def test_retrier_custom():
 
 
 def test_retrier_assestion_error():
-    with pytest.raises(AssertionError):
+    with pytest.raises(TypeError):
         Retrier(timeout='foo')
-    with pytest.raises(AssertionError):
+    with pytest.raises(ValueError):
         Retrier(timeout=-1)
 
 
@@ -61,7 +70,8 @@ def test_retrier_run_valid_retries(MagicMock):
     task = MagicMock(side_effect=iterable)
     on_retry = MagicMock()
 
-    retrier = Retrier(backoff=ConstantBackoff(interval=0), on_retry=on_retry)
+    retrier = Retrier(backoff=ConstantBackoff(interval=0), on_retry=on_retry,
+                      sleep_fn=noop_sleep)
     retrier.run(task, 2, 4, foo='bar')
 
     assert task.called
@@ -75,6 +85,19 @@ def test_retrier_run_valid_retries(MagicMock):
     assert retrier.error is None
 
 
+def test_retrier_run_no_output(MagicMock, capsys):
+    iterable = (ValueError, RuntimeError, True)
+    task = MagicMock(side_effect=iterable)
+
+    retrier = Retrier(timeout=10, backoff=ConstantBackoff(interval=0),
+                      sleep_fn=noop_sleep)
+    retrier.run(task)
+
+    out, err = capsys.readouterr()
+    assert out == ''
+    assert err == ''
+
+
 def test_retrier_evaluator(MagicMock):
     iterable = (1, 2, 3, 4)
     task = MagicMock(side_effect=iterable)
@@ -86,6 +109,7 @@ def test_retrier_evaluator(MagicMock):
         return False
 
     retrier = Retrier(evaluator=evaluator, on_retry=on_retry,
+                      sleep_fn=noop_sleep,
                       backoff=ConstantBackoff(interval=0, retries=10))
 
     res = retrier.run(task, 2, 4, foo='bar')
@@ -113,6 +137,7 @@ def test_retrier_error_evaluator_default(MagicMock):
         raise ImportError('pass error')
 
     retrier = Retrier(evaluator=evaluator, on_retry=on_retry,
+                      sleep_fn=noop_sleep,
                       backoff=ConstantBackoff(interval=0, retries=10))
 
     with pytest.raises(ImportError):
@@ -145,10 +170,11 @@ def test_retrier_error_evaluator_custom(MagicMock):
 
     def error_evaluator(err):
         # Returning True means retry the operation, otherwise stop
-        return isinstance(err, (ValueError, RuntimeError, SyntaxError))
+        return isinstance(err, RETRYABLE_ERRORS)
 
     retrier = Retrier(evaluator=evaluator, on_retry=on_retry,
                       error_evaluator=error_evaluator,
+                      sleep_fn=noop_sleep,
                       backoff=ConstantBackoff(interval=0, retries=10))
 
     with pytest.raises(ImportError):
@@ -169,7 +195,8 @@ def test_retrier_run_max_retries_error(MagicMock):
     iterable = (ValueError, RuntimeError, NotImplementedError)
     task = MagicMock(side_effect=iterable)
 
-    retrier = Retrier(backoff=ConstantBackoff(interval=0, retries=2))
+    retrier = Retrier(backoff=ConstantBackoff(interval=0, retries=2),
+                      sleep_fn=noop_sleep)
 
     with pytest.raises(MaxRetriesExceeded):
         retrier.run(task, 2, 4, foo='bar')
@@ -182,27 +209,128 @@ def test_retrier_run_max_retries_error(MagicMock):
     assert isinstance(retrier.error, NotImplementedError)
 
 
-def test_retrier_run_max_timeout(MagicMock):
+def test_retrier_run_sleep_delay(MagicMock):
+    task = MagicMock(side_effect=(ValueError, RuntimeError, 'foo'))
+    sleep = MagicMock()
+
+    retrier = Retrier(backoff=ConstantBackoff(interval=.25), sleep_fn=sleep)
+    assert retrier.run(task) == 'foo'
+    assert sleep.call_count == 2
+    assert [call[0] for call in sleep.call_args_list] == [(.25,), (.25,)]
+
+    for backoff in (FibonacciBackoff(), ExponentialBackOff(interval=.1)):
+        task = MagicMock(side_effect=(ValueError, RuntimeError, 'foo'))
+        sleep = MagicMock()
+        delays = []
+
+        retrier = Retrier(backoff=backoff, sleep_fn=sleep,
+                          on_retry=lambda err, delay: delays.append(delay))
+        assert retrier.run(task) == 'foo'
+        assert len(delays) == 2
+        assert [call[0][0] for call in sleep.call_args_list] == delays
+
+
+def test_retrier_run_max_timeout(MagicMock, clock):
     iterable = (ValueError, NotImplementedError, RuntimeError, Exception)
     task = MagicMock(side_effect=iterable)
 
     retrier = Retrier(timeout=0.3, backoff=ConstantBackoff(interval=0.12))
+    assert retrier.sleep == clock.sleep
 
     with pytest.raises(RetryTimeoutError):
         retrier.run(task, 2, 4, foo='bar')
 
     assert task.called
-    assert task.call_count >= 2
+    assert task.call_count == 3
     task.assert_called_with(2, 4, foo='bar')
 
-    assert retrier.attempts in range(2, 4)
-    assert isinstance(retrier.error, (NotImplementedError, RuntimeError))
+    assert retrier.attempts == 3
+    assert isinstance(retrier.error, RuntimeError)
+
+
+def test_retrier_whitelisted_error_override(MagicMock):
+    class CustomRetrier(Retrier):
+        def is_whitelisted_error(self, err):
+            return not isinstance(err, KeyError)
+
+    task = MagicMock(side_effect=(ValueError, KeyError, 'foo'))
+    retrier = CustomRetrier(backoff=ConstantBackoff(interval=0),
+                            sleep_fn=noop_sleep)
+    with pytest.raises(KeyError):
+        retrier.run(task)
+    assert task.call_count == 2
+
+
+def test_retrier_custom_backoff_stop(MagicMock):
+    class FloatBackoff(Backoff):
+        def reset(self):
+            pass
+
+        def next(self):
+            # Equal but not identical to `Backoff.STOP`
+            return float(Backoff.STOP)
+
+    task = MagicMock(side_effect=RuntimeError)
+    retrier = Retrier(backoff=FloatBackoff(), sleep_fn=noop_sleep)
+    with pytest.raises(MaxRetriesExceeded):
+        retrier.run(task)
+    assert task.call_count == 1
+
+
+def test_retrier_compat_hooks(MagicMock):
+    on_retry = MagicMock()
+    retrier = Retrier(on_retry=on_retry,
+                      backoff=ConstantBackoff(interval=.1, retries=1))
+
+    err = RuntimeError('retry me')
+    retrier._handle_error(err)
+    assert retrier.error is err
+    with pytest.raises(ImportError):
+        retrier._handle_error(ImportError())
+
+    retrier.error = err
+    assert retrier._get_delay() == .1
+    with pytest.raises(MaxRetriesExceeded):
+        retrier._get_delay()
+
+    retrier._notify_subscriber(.1)
+    on_retry.assert_called_once_with(err, .1)
+
+
+def test_retrier_overridden_hooks(MagicMock):
+    calls = []
+
+    class CustomRetrier(Retrier):
+        def _handle_error(self, err):
+            calls.append('error')
+            super()._handle_error(err)
+
+        def _get_delay(self):
+            calls.append('delay')
+            return super()._get_delay()
+
+        def _notify_subscriber(self, delay):
+            calls.append('notify')
+            super()._notify_subscriber(delay)
+
+    on_retry = MagicMock()
+    task = MagicMock(side_effect=(ValueError, 'foo'))
+    retrier = CustomRetrier(on_retry=on_retry, sleep_fn=noop_sleep,
+                            backoff=ConstantBackoff(interval=0))
+    assert retrier.run(task) == 'foo'
+    assert calls == ['error', 'delay', 'notify']
+    assert on_retry.call_count == 1
+
+    task = MagicMock(side_effect=ImportError)
+    with pytest.raises(ImportError):
+        retrier.run(task)
+    assert calls[-1] == 'error'
 
 
 def test_retrier_istimeout():
     assert Retrier().istimeout(1234) is False
 
-    now = time.time() - 100
+    now = time.monotonic() - 100
     assert Retrier(timeout=1).istimeout(now) is True
 
 
@@ -224,7 +352,6 @@ def test_retrier_context_manager(MagicMock):
 
 
 def test_retrier_context_manager_forward_error_message():
-    with pytest.raises(RuntimeError) as excinfo:
+    with pytest.raises(RuntimeError, match=r'^Error message here\.$'):
         with Retrier():
             raise RuntimeError('Error message here.')
-    assert str(excinfo.value) == 'Error message here.'
@@ -1,8 +1,14 @@
 # -*- coding: utf-8 -*-
-import pytest
+import gc
+import sys
+import asyncio
+import weakref
 import functools
-from riprova.constants import PY_34
-from riprova import retry, ConstantBackoff
+import subprocess
+import pytest
+from riprova.constants import PY_37
+from riprova import (retry, Retrier, ConstantBackoff, ErrorWhitelist,
+                     MaxRetriesExceeded, add_whitelist_error)
 
 
 def task(times):
@@ -51,16 +57,12 @@ def test_retry_decorator():
     assert task(2) == 4
 
 
-@pytest.mark.skipif(not PY_34, reason='requires Python 3.4+')
-def test_retry_async(MagicMock):
-    import asyncio
-    loop = asyncio.get_event_loop()
+def test_retry_async(MagicMock, run_coro):
 
     # Track coro calls
     count = {'calls': 0}
 
-    @asyncio.coroutine
-    def coro(times, x):
+    async def coro(times, x):
         count['calls'] += 1
 
         if count['calls'] < times:
@@ -72,9 +74,103 @@ def test_retry_async(MagicMock):
     retrier = retry(on_retry=on_retry, backoff=ConstantBackoff(interval=.2,
                                                                retries=10))
 
-    decorator = retrier(asyncio.coroutine(functools.partial(coro, 4)))
-    result = loop.run_until_complete(decorator(2))
+    decorator = retrier(functools.partial(coro, 4))
+    result = run_coro(decorator(2))
     assert result == 4
 
     assert on_retry.called
     assert on_retry.call_count == 3
+
+
+def test_retry_reentrant():
+    count = {'calls': 0}
+
+    @retry(backoff=ConstantBackoff(interval=0, retries=5))
+    def task(depth):
+        count['calls'] += 1
+        if count['calls'] % 2:
+            raise RuntimeError('call error')
+        return task(depth - 1) + 1 if depth else 0
+
+    assert task(3) == 3
+    assert task(0) == 0
+
+
+def test_retry_releases_error():
+    class Arg(object):
+        pass
+
+    @retry(backoff=ConstantBackoff(interval=0, retries=1))
+    def task(arg):
+        raise RuntimeError('call error')
+
+    arg = Arg()
+    ref = weakref.ref(arg)
+    try:
+        task(arg)
+    except MaxRetriesExceeded:
+        pass
+
+    del arg
+    gc.collect()
+    assert ref() is None
+
+
+def test_retry_whitelist_changes():
+    class CustomError(Exception):
+        pass
+
+    calls = {'count': 0}
+
+    @retry(backoff=ConstantBackoff(interval=0, retries=3))
+    def task(error=None):
+        calls['count'] += 1
+        if error:
+            raise error
+        return True
+
+    assert task() is True
+
+    # Global whitelist changes apply to already used decorated functions
+    add_whitelist_error(CustomError)
+    try:
+        with pytest.raises(CustomError):
+            task(CustomError)
+        assert calls['count'] == 2
+    finally:
+        ErrorWhitelist.WHITELIST.discard(CustomError)
+
+    # And so do class level whitelist changes
+    Retrier.whitelist = ErrorWhitelist([KeyError])
+    try:
+        with pytest.raises(KeyError):
+            task(KeyError)
+        assert calls['count'] == 3
+    finally:
+        Retrier.whitelist = None
+
+    with pytest.raises(MaxRetriesExceeded):
+        task(CustomError)
+    assert calls['count'] == 7
+
+
+def test_retry_async_concurrent(run_coro):
+
+    @retry(backoff=ConstantBackoff(interval=.01, retries=5))
+    async def coro(x, attempts={}):
+        attempts[x] = attempts.get(x, 0) + 1
+        await asyncio.sleep(0)
+        if attempts[x] < 3:
+            raise RuntimeError('foo')
+        return x * x
+
+    assert asyncio.iscoroutinefunction(coro)
+    result = run_coro(asyncio.gather(coro(2), coro(3)))
+    assert result == [4, 9]
+
+
+@pytest.mark.skipif(not PY_37, reason='requires lazy module attributes')
+def test_retry_import_without_asyncio():
+    # Synchronous only programs must not import asyncio
+    code = 'import sys, riprova; assert "asyncio" not in sys.modules'
+    subprocess.check_call([sys.executable, '-c', code])
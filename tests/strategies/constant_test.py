@@ -50,11 +50,11 @@ def test_constant_backoff_max_retries():
 
 
 def test_constant_backoff_validation():
-    with pytest.raises(AssertionError):
+    with pytest.raises(TypeError):
         ConstantBackoff(retries='foo')
-    with pytest.raises(AssertionError):
+    with pytest.raises(ValueError):
         ConstantBackoff(retries=-1)
-    with pytest.raises(AssertionError):
+    with pytest.raises(TypeError):
         ConstantBackoff(interval='foo')
-    with pytest.raises(AssertionError):
+    with pytest.raises(ValueError):
         ConstantBackoff(interval=-1)
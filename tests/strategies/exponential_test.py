@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
+import time
 import pytest
 from riprova import ExponentialBackOff
+from riprova.strategies.exponential import now
 
 
 def test_exponential_backoff_defaults():
@@ -35,20 +37,19 @@ def test_exponential_backoff():
     assert backoff.interval == interval * 1000
 
     delay = backoff.next()
-    assert delay in range(interval, interval + 10)
+    assert 1 <= delay <= 3
     assert backoff.current_interval == backoff.interval + 1000
 
     delay = backoff.next()
-    assert delay in range(interval + int(interval * factor) - 5,
-                          interval + int(interval * factor) + 5)
+    assert 1.5 <= delay <= 4.5
     assert backoff.current_interval == backoff.interval + 2500
 
     delay = backoff.next()
-    assert delay >= 4 and delay <= 5.0
+    assert 2.25 <= delay <= 6.75
     assert backoff.current_interval == 6750.0
 
     delay = backoff.next()
-    assert delay >= 6 and delay <= 7
+    assert 3.37 <= delay <= 10.13
     assert backoff.current_interval == 10125.0
 
     backoff.reset()
@@ -58,19 +59,116 @@ def test_exponential_backoff():
 
 
 def test_exponential_backoff_validation():
-    with pytest.raises(AssertionError):
+    with pytest.raises(TypeError):
         ExponentialBackOff(factor='foo')
-    with pytest.raises(AssertionError):
+    with pytest.raises(TypeError):
         ExponentialBackOff(factor=None)
-    with pytest.raises(AssertionError):
+    with pytest.raises(TypeError):
         ExponentialBackOff(interval='foo')
-    with pytest.raises(AssertionError):
+    with pytest.raises(ValueError):
         ExponentialBackOff(interval=-1)
-    with pytest.raises(AssertionError):
+    with pytest.raises(TypeError):
         ExponentialBackOff(max_interval='foo')
-    with pytest.raises(AssertionError):
+    with pytest.raises(TypeError):
         ExponentialBackOff(max_elapsed='foo')
-    with pytest.raises(AssertionError):
+    with pytest.raises(TypeError):
         ExponentialBackOff(multiplier='foo')
-    with pytest.raises(AssertionError):
+    with pytest.raises(ValueError):
         ExponentialBackOff(multiplier=-1)
+
+
+def test_exponential_backoff_intervals():
+    backoff = ExponentialBackOff(interval=1, factor=0, max_interval=5,
+                                 multiplier=2)
+    delays = [backoff.next() for _ in range(6)]
+    assert delays == [1, 2, 4, 5, 5, 5]
+    assert backoff.current_interval == backoff.max_interval
+
+    backoff.reset()
+    assert backoff.current_interval == backoff.interval
+    assert [backoff.next() for _ in range(6)] == delays
+
+
+def test_exponential_backoff_config_changes():
+    backoff = ExponentialBackOff(interval=1, factor=0, max_interval=5,
+                                 multiplier=2)
+    assert [backoff.next() for _ in range(3)] == [1, 2, 4]
+
+    # Configuration changes take effect on reset
+    backoff.interval = 500
+    backoff.multiplier = 3
+    backoff.reset()
+    assert [backoff.next() for _ in range(3)] == [.5, 1.5, 4.5]
+
+    backoff.factor = 1
+    backoff.reset()
+    assert 0 <= backoff.next() <= 1
+
+    # Assigned intervals are grown on the next attempts
+    backoff.factor = 0
+    backoff.reset()
+    backoff.current_interval = 1000
+    assert backoff.current_interval == 1000
+    assert [backoff.next() for _ in range(3)] == [1, 3, 5]
+
+    backoff.reset()
+    assert backoff.current_interval == backoff.interval
+    assert backoff.next() == .5
+
+
+def test_exponential_backoff_peek():
+    backoff = ExponentialBackOff(interval=.1, factor=0, max_interval=1)
+    expected = [.1, .15, .23, .34, .51, .76, 1, 1]
+    assert [backoff.peek(n) for n in range(8)] == expected
+
+    # Peeking does not consume retry attempts
+    assert backoff.next() == .1
+    assert backoff.peek(0) == .15
+    assert backoff.peek(2) == .34
+    assert backoff.next() == .15
+
+    with pytest.raises(ValueError):
+        backoff.peek(-1)
+    with pytest.raises(ValueError):
+        backoff.peek(-5)
+
+
+def test_exponential_backoff_max_elapsed():
+    backoff = ExponentialBackOff(interval=0, max_elapsed=.01)
+    assert backoff.next() == 0
+    assert backoff.next() == 0
+
+    time.sleep(.02)
+    assert backoff.elapsed >= 20
+    assert backoff.next() == backoff.STOP
+
+    backoff.reset()
+    assert backoff.next() == 0
+
+
+def test_exponential_backoff_jitter():
+    backoff = ExponentialBackOff(interval=1, jitter='full')
+    assert backoff.jitter == 'full'
+    for _ in range(5):
+        current = backoff.current_interval / 1000
+        assert 0 <= backoff.next() <= current
+
+    backoff = ExponentialBackOff(interval=1, max_interval=5,
+                                 jitter='decorrelated')
+    assert backoff.jitter == 'decorrelated'
+    last = 1
+    for _ in range(10):
+        delay = backoff.next()
+        assert 1 <= delay <= min(last * 3, 5)
+        last = delay
+
+    with pytest.raises(ValueError):
+        ExponentialBackOff(jitter='foo')
+
+
+def test_exponential_backoff_now():
+    start = time.monotonic() * 1000
+    current = now()
+    assert isinstance(current, int)
+    # Allow for float rounding of the seconds based clock reading
+    assert start - 1 <= current <= time.monotonic() * 1000 + 1
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import pytest
 from riprova import FibonacciBackoff
+from riprova.strategies.fibonacci import fibonacci
 
 
 def test_fibonacci_backoff_defaults():
@@ -60,15 +61,42 @@ def test_fibonacci_backoff_max_retries():
 
 
 def test_fibonacci_backoff_validation():
-    with pytest.raises(AssertionError):
+    with pytest.raises(TypeError):
         FibonacciBackoff(retries='foo')
-    with pytest.raises(AssertionError):
+    with pytest.raises(ValueError):
         FibonacciBackoff(retries=-1)
-    with pytest.raises(AssertionError):
+    with pytest.raises(TypeError):
         FibonacciBackoff(initial='foo')
-    with pytest.raises(AssertionError):
+    with pytest.raises(ValueError):
         FibonacciBackoff(initial=-1)
-    with pytest.raises(AssertionError):
+    with pytest.raises(TypeError):
         FibonacciBackoff(multiplier=None)
-    with pytest.raises(AssertionError):
+    with pytest.raises(ValueError):
         FibonacciBackoff(multiplier=-1)
+
+
+def test_fibonacci_backoff_no_max_retries():
+    backoff = FibonacciBackoff(retries=0)
+    for i in range(50):
+        assert backoff.next() != backoff.STOP
+    assert backoff.retries == 50
+
+
+def test_fibonacci_backoff_initial():
+    backoff = FibonacciBackoff(initial=2, multiplier=3, retries=0)
+    delays = [backoff.next() for _ in range(6)]
+    assert delays == [n * 2 * 3 for n in (1, 2, 3, 5, 8, 13)]
+    assert backoff.prev == 16
+    assert backoff.current == 26
+
+    backoff.reset()
+    assert backoff.prev == 0
+    assert backoff.current == 2
+    assert [backoff.next() for _ in range(6)] == delays
+
+
+def test_fibonacci_series():
+    prev, current = 0, 1
+    for n in range(200):
+        assert fibonacci(n) == prev
+        prev, current = current, prev + current